@@ -0,0 +1,3 @@
+#The scripts of FALCON are in the folder above (FALCON_v1_1.py).
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,46 @@
+#Tests of the persistent MFE cache (cached_MFEs). Run from the folder of FALCON: python3 -m pytest tests
+import FALCON_v1_1 as FALCON
+
+def test_hits_and_eviction(tmp_path, monkeypatch):
+    monkeypatch.setattr(FALCON, 'MFE_cache', str(tmp_path/'MFE_cache.sqlite'))
+    monkeypatch.setattr(FALCON, 'MFE_cache_size', 3)
+    monkeypatch.setattr(FALCON, 'MFE_cache_db', None)
+    #(the MFE is the length of the seq, and every folded seq is recorded)
+    folded = []
+    monkeypatch.setattr(FALCON, 'fold_MFEs', lambda NAseqs: folded.extend(NAseqs) or [float(len(NAseq)) for NAseq in NAseqs])
+    seqs = ['ACGTTGCAAGCTTGCA', 'GGGAAACCCTTTGGGA', 'ATATATGCGCGCATAT', 'CCATGGTTAACCATGG']
+    FALCON.start_MFE_cache_run()
+    #a seq asked for twice in the same call is only folded once, and it isn't a hit.
+    MFEs = FALCON.cached_MFEs([seqs[0], seqs[0], seqs[1]])
+    assert MFEs[0] == MFEs[1] and sorted(folded) == sorted(seqs[:2])
+    assert FALCON.finish_MFE_cache_run() == (0, 2)
+    FALCON.start_MFE_cache_run()
+    FALCON.cached_MFEs([seqs[0], seqs[2], seqs[3]])
+    assert FALCON.finish_MFE_cache_run() == (1, 2)
+    #at most MFE_cache_size MFEs are kept, right after they are added: the least recently used one (seqs[1]) is gone.
+    kept = {row[0] for row in FALCON.MFE_cache_connect().execute('SELECT seq FROM mfe')}
+    assert kept == {seqs[0], seqs[2], seqs[3]}
+
+#seqfold's placeholders (1600 for an isolated pair, +/-inf) are -inf, with or without the cache: they never have the highest MFE.
+def test_placeholders(tmp_path, monkeypatch):
+    MFEs = {'ACGTTGCAAGCTTGCA': 1600.0, 'GGGAAACCCTTTGGGA': -3.2, 'ATATATGCGCGCATAT': float('inf'), 'CCATGGTTAACCATGG': float('-inf')}
+    monkeypatch.setattr(FALCON, 'fold_MFEs', lambda NAseqs: [MFEs[NAseq] for NAseq in NAseqs])
+    monkeypatch.setattr(FALCON, 'MFE_proxy_pool', None)
+    for cache in [None, str(tmp_path/'MFE_cache.sqlite')]:
+        monkeypatch.setattr(FALCON, 'MFE_cache', cache) ; monkeypatch.setattr(FALCON, 'MFE_cache_db', None)
+        starts, folded = FALCON.start_MFEs(list(MFEs))
+        assert folded == [float('-inf'), -3.2, float('-inf'), float('-inf')]
+        assert starts[folded.index(max(folded))] == 'GGGAAACCCTTTGGGA'
+    #(a seq that seqfold gives the placeholder 1600)
+    if FALCON.seq_fold_exists:
+        monkeypatch.undo()
+        monkeypatch.setattr(FALCON, 'MFE_cache', None)
+        assert FALCON.dg('AAAAAAAAAAAAAAAAAAAAT', temp=FALCON.MFE_temp) == 1600
+        assert FALCON.cached_MFEs(['AAAAAAAAAAAAAAAAAAAAT']) == [float('-inf')]
+
+#The correlation of the MFE prefilter leaves out the placeholders (here, they would make it negative).
+def test_proxy_correlation_without_placeholders():
+    pairs = [(-1.0, -4.0), (-2.0, -5.0), (-3.0, -6.5), (-4.0, -7.0), (-5.0, 1600.0), (-6.0, float('inf'))]
+    counted, Pearson, Spearman = FALCON.MFE_proxy_correlation(pairs)
+    assert counted == 4 and Pearson > 0.95 and Spearman == 1
+    assert FALCON.MFE_proxy_correlation(pairs[4:]) is None
@@ -0,0 +1,75 @@
+#Tests of the candidates of the 'sampling' engine (build_candidate). Run from the folder of FALCON: python3 -m pytest tests
+import random
+from scipy.optimize import leastsq
+import FALCON_v1_1 as FALCON
+
+#Installs the model of the expression system 'ex_sys' for the desired GC 'des_GC' (as the main script does) and returns the inherited tuple.
+def install(ex_sys, des_GC, Max_threshold):
+    model = FALCON.load_model(ex_sys)
+    lst_parameters = leastsq(FALCON.residuals, [0, 1, 1, 1], args=([-1, -0.9, 0, 0.9, 1], [0.000000001, 40, des_GC, 70, 100]))
+    FALCON.install_model((ex_sys, des_GC, model, False), Max_threshold, 'sampling', FALCON.GCcontent_Table(model, lst_parameters, des_GC))
+    return (ex_sys, des_GC, model, False)
+
+#The rounds of back_translate: SeqScore of every round (None if given up), with or without the best SeqScore so far.
+def round_scores(aaSeq, Max_threshold, tuple_inherited, seed, bound):
+    random.seed(seed) ; scores = []
+    for Round in range(FALCON.n_candidates):
+        rnd = random.Random(random.getrandbits(64))
+        best = max([score for score in scores if score is not None], default=None) if bound else None
+        scores.append(FALCON.build_candidate(aaSeq, [], Max_threshold, tuple_inherited, rnd, best)[0])
+    return scores
+
+#A GC-rich protein: its candidates often end above the MaxThreshold and are repaired (repair_GC) or started over.
+def test_bound_doesnt_change_the_winner():
+    tuple_inherited = install('3', 55, 60)
+    aaSeq = ('GPRAC'*45)[:222]
+    for seed in range(4):
+        unbounded = round_scores(aaSeq, 60, tuple_inherited, seed, bound=False)
+        bounded = round_scores(aaSeq, 60, tuple_inherited, seed, bound=True)
+        for Round, (score, bounded_score) in enumerate(zip(unbounded, bounded)):
+            if bounded_score is None:
+                #only the candidates that can't beat the best one so far are given up
+                assert score < max(s for s in bounded[:Round] if s is not None)
+            else:
+                assert bounded_score == score
+        assert max(s for s in bounded if s is not None) == max(unbounded)
+
+#A protein whose codons have at most one G/C: the 48% MinThreshold is out of reach. The thresholds are moved to the highest
+#GC% it can have, and the candidate is finished without repairs or restarts.
+def test_unreachable_GC_thresholds():
+    tuple_inherited = install('3', 55, 60)
+    aaSeq = 'M' + 'KNFIY'*30 ; aaIdx = [FALCON.AA_index[aa] for aa in aaSeq]
+    MinThreshold, MaxThreshold, reachable = FALCON.GC_thresholds(aaIdx, [], 60, tuple_inherited[2])
+    assert not reachable and MaxThreshold == 60
+    assert MinThreshold == FALCON.GCcont_counts(len(aaSeq), 2*len(aaSeq))
+    SeqScore, newSeq = FALCON.build_candidate(aaSeq, [], 60, tuple_inherited, random.Random(0))
+    assert newSeq.length == len(aaSeq) and newSeq.rollbacks == 0
+
+#A finished candidate below the MinThreshold (the AT-richest synonymous codons that don't make a motif): repair_GC brings it
+#within the thresholds with synonymous codons after 'start', without making a motif, slicing it back or starting it over.
+def test_repair_GC():
+    tuple_inherited = install('3', 55, 60) ; model = tuple_inherited[2]
+    aaSeq = 'M' + 'GPRASLEVKT'*20 ; aaIdx = [FALCON.AA_index[aa] for aa in aaSeq]
+    newSeq = FALCON.CandidateSeq(len(aaSeq))
+    for a in aaIdx:
+        Cdns = tuple(model['choices'][a, :model['n_choices'][a]].tolist())
+        excluded = newSeq.excluded(Cdns)
+        newSeq.append(min([cdn for cdn, ex in zip(Cdns, excluded) if not ex], key=lambda cdn: FALCON.GC_per_codon[cdn]))
+    before = newSeq.codons() ; start = 20
+    assert FALCON.GCcont(newSeq.NAseq()) < 48
+    assert newSeq.scanner.search(RS=True, HP=True, ATs=True, Pyr=True) is None
+    assert FALCON.repair_GC(newSeq, aaIdx, start, 48, 60, model, random.Random(0))
+    seq = newSeq.NAseq() ; after = newSeq.codons()
+    assert 48 <= FALCON.GCcont(seq) <= 60 and FALCON.GCcont_counts(*newSeq.GC_counts()) == FALCON.GCcont(seq)
+    assert all(FALCON.Motifs(seq, **{kind: True}) is None for kind in ['RS', 'HP', 'ATs', 'Pyr'])
+    assert after[:start] == before[:start] and after != before
+    assert all(cdn in model['choices'][a, :model['n_choices'][a]] for a, cdn in zip(aaIdx, after))
+    assert newSeq.length == len(aaSeq) and newSeq.rollbacks == 0
+
+#The GC_table is float32 (half the shared memory of float64), and at the desired GC% it keeps the weights of the model.
+def test_GC_table_float32():
+    model = FALCON.load_model('1')
+    lst_parameters = leastsq(FALCON.residuals, [0, 1, 1, 1], args=([-1, -0.9, 0, 0.9, 1], [0.000000001, 40, 55, 70, 100]))
+    GC_table = FALCON.GCcontent_Table(model, lst_parameters, 55)
+    assert GC_table.dtype == 'float32' and GC_table.nbytes == 4*len(model['weights'])*1001*6
+    assert (GC_table[:, 550] == model['weights'].astype('float32')).all()
@@ -0,0 +1,24 @@
+#Every engine (see Engine_functions) backtranslates a protein, with and without the MFE start. Run from the folder of FALCON:
+#python3 -m pytest tests
+import random
+import pytest
+import FALCON_v1_1 as FALCON
+from test_build_candidate import install
+
+GFP = 'MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKFICTTGKLPVPWPTLVTTFSYGVQCFSRYPDHMKQHDFFKSAMPEGYVQERTIFFKDDGNYKTRAEVKFEGDTLVNRIELKGIDFKEDGNILGHKLEYNYNSHNVYIMADKQKNGIKVNFKIRHNIEDGSVQLADHYQQNTPIGDGPVLLPDNHYLSTQSALSKDPNEKRDHMVLLEFVTAAGITHGMDELYK*'
+
+@pytest.mark.parametrize('engine', sorted(FALCON.Engine_functions))
+@pytest.mark.parametrize('seq_fold', [False, True])
+def test_engine(engine, seq_fold, monkeypatch):
+    if seq_fold and not FALCON.seq_fold_exists:
+        pytest.skip('seqfold is not installed')
+    monkeypatch.setattr(FALCON, 'MFE_cache', None)
+    ex_sys, des_GC, model, fold = install('3', 55, 60)
+    random.seed(0)
+    GeneName, NAseq = FALCON.Engine_functions[engine]('>GFP', GFP, 60, (ex_sys, des_GC, model, seq_fold), 3)
+    #the seq codes for the protein, with the codons of the model
+    cdns = [FALCON.Codon_index[cdn] for cdn in FALCON.toCodonList(NAseq)]
+    assert len(cdns) == len(GFP)
+    for aa, cdn in zip(GFP, cdns):
+        a = FALCON.AA_index[aa]
+        assert cdn in model['choices'][a, :model['n_choices'][a]]
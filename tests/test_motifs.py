@@ -0,0 +1,84 @@
+#Tests of the streaming motif scanner (MotifScanner) against the regular expressions of Motifs(). Run from the folder of FALCON: python3 -m pytest tests
+import random, re
+import pytest
+import FALCON_v1_1 as FALCON
+
+Kinds = ['RS', 'HP', 'ATs', 'Pyr']
+
+#random seqs rich in the motifs: A/T or C/T biased, and with restriction sites pasted in.
+def random_seqs(sites, n=300, seed=0):
+    rnd = random.Random(seed)
+    for k in range(n):
+        alphabet = ['ACGT', 'AATTCG', 'CCTTAG', 'AAAATTTTCG'][k % 4]
+        seq = ''.join(rnd.choice(alphabet) for _ in range(rnd.randrange(0, 120)))
+        for _ in range(rnd.randrange(3)):
+            at = rnd.randrange(len(seq)+1)
+            seq = seq[:at] + rnd.choice(sites) + seq[at:]
+        yield seq
+
+def regex_start(seq, kind):
+    found = FALCON.Motifs(seq, **{kind: True})
+    return found.start() if found else None
+
+def scanner_starts(scanner):
+    return [scanner.search(**{kind: True}) for kind in Kinds]
+
+#the restriction sites of the panel, and a larger one with IUPAC codes and overlapping sites.
+@pytest.fixture(params=[None, ['BamHI', 'GGNCC', 'EcoRI', 'HindIII', 'GGTCTC', 'CCATGG']])
+def panel(request, monkeypatch):
+    if request.param is None:
+        return FALCON.RS_sites
+    sites = FALCON.Panel_sites(request.param)
+    monkeypatch.setattr(FALCON, 'RS_regex', re.compile('|'.join(f"({site})" for site in sites)))
+    return sites
+
+def test_same_as_regex(panel):
+    for seq in random_seqs(panel):
+        scanner = FALCON.MotifScanner(panel)
+        #(in pieces, as the codons are appended)
+        for k in range(0, len(seq), 3):
+            scanner.scan(seq[k:k+3])
+        assert scanner_starts(scanner) == [regex_start(seq, kind) for kind in Kinds], seq
+
+#rewinding to a position and scanning other bases gives the same as scanning the new seq from scratch.
+def test_rewind(panel):
+    rnd = random.Random(1)
+    seqs = list(random_seqs(panel, seed=2))
+    for seq, other in zip(seqs, seqs[1:]):
+        scanner = FALCON.MotifScanner(panel)
+        scanner.scan(seq)
+        position = rnd.randrange(len(seq)+1)
+        scanner.rewind(position)
+        assert scanner_starts(scanner) == [regex_start(seq[:position], kind) for kind in Kinds]
+        scanner.scan(other)
+        assert scanner_starts(scanner) == [regex_start(seq[:position]+other, kind) for kind in Kinds], (seq[:position], other)
+        scanner.reset()
+        assert scanner_starts(scanner) == [None]*4 and scanner.length == 0
+
+#a candidate sliced back (restore) and grown again keeps its scanner in step with its seq.
+def test_candidate_restore():
+    rnd = random.Random(3)
+    for _ in range(200):
+        newSeq = FALCON.CandidateSeq(100)
+        newSeq.extend([rnd.randrange(len(FALCON.Codons)) for _ in range(rnd.randrange(1, 40))])
+        newSeq.restore(rnd.randrange(newSeq.length+1))
+        newSeq.extend([rnd.randrange(len(FALCON.Codons)) for _ in range(rnd.randrange(40))])
+        seq = newSeq.NAseq()
+        assert scanner_starts(newSeq.scanner) == [regex_start(seq, kind) for kind in Kinds], seq
+
+#enzyme names and recognition sites of enzyme_panel: IUPAC codes expanded, reverse complements added.
+def test_panel_sites():
+    assert FALCON.Panel_sites(['BamHI']) == ['GGATCC']
+    assert FALCON.Panel_sites(['GGNCC']) == ['GGACC', 'GGCCC', 'GGGCC', 'GGTCC']
+    #(not palindromic: both strands)
+    assert FALCON.Panel_sites(['GGTCTC']) == ['GAGACC', 'GGTCTC']
+    assert FALCON.Panel_sites(['gcwgc']) == ['GCAGC', 'GCTGC']
+    assert FALCON.Panel_sites(['RCATGY']) == ['ACATGC', 'ACATGT', 'GCATGC', 'GCATGT']
+    assert FALCON.Panel_sites(['ACCTGC']) == ['ACCTGC', 'GCAGGT']
+    assert FALCON.Panel_sites(['BamHI', 'GGNCC', 'GGATCC', 'SpeI']) == ['ACTAGT', 'GGACC', 'GGATCC', 'GGCCC', 'GGGCC', 'GGTCC']
+    assert FALCON.Panel_sites([]) == []
+
+@pytest.mark.parametrize('entry', ['BamH1', 'GGXCC', 'GG-CC', ''])
+def test_panel_sites_unknown(entry):
+    with pytest.raises(ValueError, match='enzyme_panel'):
+        FALCON.Panel_sites(['BamHI', entry])
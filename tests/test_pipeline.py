@@ -0,0 +1,71 @@
+#Tests of the two-stage backtranslation (Pipeline), with executors that run the tasks only when the test says so, in any order.
+#Run from the folder of FALCON: python3 -m pytest tests
+import concurrent.futures, random
+import pytest
+import FALCON_v1_1 as FALCON
+
+class Executor:
+    """Keeps the submitted tasks pending until finish() runs one of them."""
+    def __init__(self):
+        self.pending = [] ; self.most = 0
+    def submit(self, function, *args):
+        future = concurrent.futures.Future()
+        self.pending.append((future, function, args)) ; self.most = max(self.most, len(self.pending))
+        return future
+    def finish(self, k):
+        future, function, args = self.pending.pop(k)
+        future.set_result(function(*args))
+        return future
+
+#Tasks that only return what they were given: the seq start of a prefix, the seed of a protein or of a round.
+#(the rounds have the same SeqScore, so the winner is the round that is put in the candidates last)
+@pytest.fixture(autouse=True)
+def tasks(monkeypatch):
+    monkeypatch.setattr(FALCON, 'MFE_start_task', lambda prefix, seed: ('ATG'+'GCT'*19, [(0.0, -1.0)]))
+    monkeypatch.setattr(FALCON, 'gene_task', lambda name, aaSeq, Seq_start, seed: (name, f"gene {seed} {Seq_start}"))
+    monkeypatch.setattr(FALCON, 'candidate_task', lambda aaSeq, Seq_start, seed: (0.0, f"round {seed} {len(Seq_start)}"))
+
+#proteins: 2 split ones and 3 isoforms (same first 20 aa in each group), 3 with a seq start of their own and 2 that don't wait for one.
+Entries = {f"long{k}": 'M'+'A'*20+'G'*(300+k) for k in range(2)}
+Entries.update({f"iso{k}": 'M'+'KLVG'*5+'S'*(30+k) for k in range(3)})
+Entries.update({f"other{k}": 'M'+'ACD'[k]+'W'*20 for k in range(3)})
+Entries.update({f"short{k}": 'MKW'[:k+1] for k in range(2)})
+Split_genes = ['long0', 'long1']
+Prefix_genes = {}
+for name in Entries:
+    if len(Entries[name]) >= 20:
+        Prefix_genes.setdefault(Entries[name][:20], []).append(name)
+
+#Runs the pipeline finishing the tasks in a random order (both stages), and checks the room of stage two after every step.
+def run(seed, queue_size):
+    rnd = random.Random(seed) ; start_executor = Executor() ; executor = Executor()
+    pipeline = FALCON.Pipeline(Entries, list(Entries), Split_genes, Prefix_genes, start_executor, executor, queue_size, random.Random(0))
+    pipeline.start()
+    while pipeline.tasks:
+        assert len(executor.pending) == pipeline.running[2] <= queue_size
+        pools = [pool for pool in [start_executor, executor] if pool.pending]
+        pool = rnd.choice(pools)
+        pipeline.collect([pool.finish(rnd.randrange(len(pool.pending)))])
+    assert not pipeline.ready and not pipeline.waiting_starts
+    return pipeline, executor
+
+@pytest.mark.parametrize('queue_size', [1, 3, 16])
+def test_queue_size(queue_size):
+    pipeline, executor = run(0, queue_size)
+    assert executor.most == queue_size
+    assert set(pipeline.out_dict) == set(Entries)
+    assert pipeline.stages[1][0] == len(Prefix_genes) and pipeline.stages[2][0] == len(Entries)
+    assert pipeline.IPC['tasks'] == len(Prefix_genes) + len(Entries) - len(Split_genes) + len(Split_genes)*FALCON.n_candidates
+
+#The rounds of a split protein finish in any order, and they are put back together in round order.
+def test_split_rounds_in_order():
+    outputs = []
+    for seed in range(5):
+        pipeline, executor = run(seed, 3)
+        for name in Split_genes:
+            seeds = [pipeline.seeds[('round', name, Round)] for Round in range(FALCON.n_candidates)]
+            assert pipeline.split_results[name] == [(0.0, f"round {s} 20") for s in seeds]
+            assert pipeline.out_dict[name] == f"round {seeds[-1]} 20"
+        outputs.append(pipeline.out_dict)
+    #(and the seeds don't depend on the order either)
+    assert all(out == outputs[0] for out in outputs)